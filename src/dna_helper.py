@@ -102,7 +102,7 @@ class dna_utility(object):
         return dna_regex
 
     @staticmethod
-    def __find_match(matcher_regex, target_dna):
+    def __find_match(matcher_regex, target_dna, start_pos=0):
         """Find first match of given sequence in an unambiguous sequence.
 
         Given a target sequence, find the first/best match of this target
@@ -114,6 +114,8 @@ class dna_utility(object):
             compiled regular expression object
         target_dna : string
             dna sequence
+        start_pos : int
+            position in target_dna to start searching from.
 
         Returns
         -------
@@ -122,7 +124,7 @@ class dna_utility(object):
             -1 if no matches.
 
         """
-        firstmatch = matcher_regex.search(target_dna)
+        firstmatch = matcher_regex.search(target_dna, start_pos)
         if firstmatch is None:
             return((-1, -1))
         else:
@@ -149,19 +151,19 @@ class dna_utility(object):
             -1 if no matches. Also returns the number of matches found
 
         """
-        cur_end = 0
         last_start = 0
         last_end = 0
         number_found = 0
         while True:
-            target_dna = target_dna[cur_end:]
+            # Search from the end of the previous match, without slicing.
             cur_start, cur_end = dna_utility.__find_match(matcher_regex,
-                                                          target_dna)
+                                                          target_dna,
+                                                          last_end)
             if cur_start == -1:
                 break
             number_found += 1
-            last_start = last_end + cur_start
-            last_end = last_end + cur_end
+            last_start = cur_start
+            last_end = cur_end
         if last_start == 0 and last_end == 0:
             last_start = -1
             last_end = -1
@@ -190,12 +192,16 @@ class dna_utility(object):
         """
         (first_start, first_end) = dna_utility.__find_match(matcher_regex,
                                                             target_dna)
-        cur_end = 0
-        number_found = 0
+        if first_start == -1:
+            return ((first_start, first_end, 0))
+        # The first match is already known, so continue counting after it
+        # instead of searching for it a second time.
+        cur_end = first_end
+        number_found = 1
         while True:
-            target_dna = target_dna[cur_end:]
             cur_start, cur_end = dna_utility.__find_match(matcher_regex,
-                                                          target_dna)
+                                                          target_dna,
+                                                          cur_end)
             if cur_start == -1:
                 break
             number_found += 1
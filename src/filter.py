@@ -232,12 +232,12 @@ class filter_sorted():
                                   others are not.")
                 raise IOError("Some sort outputs are paired end, whereas \
                               others are not.")
-            type_index = (5 if self._paired_end else 4)
             for line in sort_file:
-                toks = line.strip().split()
-                # Check if correct combi else continue on
-                if toks[type_index] != "C":
+                # Check if correct combi else continue on. The sorter writes
+                # the type as a single character in the last column.
+                if not line.endswith(("\tC\n", "\tC")):
                     continue
+                toks = line.split()
                 tag_pair = (toks[0], toks[1])
                 # raise error if tag pair not found in pool - unlikely since
                 # this should have been sorted out in sorting.
@@ -256,12 +256,11 @@ class filter_sorted():
                     count = int(toks[3])
                 if sample not in self._haps_info:
                     self._haps_info[sample] = {}
-                if seq not in self._haps_info[sample]:
-                    self._haps_info[sample][seq] = {}
-                    for rep in self._rep_info[sample]:
-                        temp_tp = self._rep_info[sample][rep]
-                        self._haps_info[sample][seq][rep] = [temp_tp, 0]
-                self._haps_info[sample][seq][replicate][1] = count
+                sample_haps = self._haps_info[sample]
+                if seq not in sample_haps:
+                    sample_haps[seq] = {rep: [temp_tp, 0] for rep, temp_tp
+                                        in self._rep_info[sample].items()}
+                sample_haps[seq][replicate][1] = count
             sort_file.close()
 
     def process_haps_info(self):
@@ -281,14 +280,13 @@ class filter_sorted():
         out_file = open(out_name, "w")
         for samp in self._haps_info:
             sample_haps = self._haps_info[samp]
-            for seq in sample_haps:
+            for seq, seq_reps in sample_haps.items():
                 counts = []
                 tag_pairs = []
-                for rep in sample_haps[seq]:
-                    (tag_pair, count) = sample_haps[seq][rep]
+                for (tag_pair, count) in seq_reps.values():
                     counts.append(count)
                     tag_pairs.append(tag_pair)
-                nreps = len(sample_haps[seq])
+                nreps = len(seq_reps)
                 valid_counts = sum([1 for x in counts if x >= self.min_count])
                 if ((valid_counts*1.0)/nreps) < self.prop_pcr:
                     continue
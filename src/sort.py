@@ -43,6 +43,7 @@ class sample_sorter():
     """
 
     _tag_dict = {}
+    _tag_match_cache = {}
     _primer_pair = None
     _primers_rgx = None
     _samp_info = {}
@@ -284,6 +285,8 @@ class sample_sorter():
                 raise IOError(tokens[0] + " already present in file.")
             forwardTag = Seq(tokens[1], IUPAC.IUPACUnambiguousDNA())
             self._tag_dict[tokens[0]] = forwardTag
+        # Tag set changed, so previously found best matches are stale.
+        self._tag_match_cache = {}
         self.logger.info("Read " + str(len(self._tag_dict)) + " valid tag \
                          combinations.")
         tag_file.close()
@@ -476,17 +479,16 @@ class sample_sorter():
         # Make a set of tags used in this pool.
         self.logger.info("Writing output files.")
         pool_tags = set()
-        pool_tag_pairs = []
-        for tag_pair in self._samp_info[pool_name]:
+        pool_tag_pairs = self._samp_info[pool_name].keys()
+        for tag_pair in pool_tag_pairs:
             pool_tags.update(tag_pair)
-            pool_tag_pairs.append(tag_pair)
         # Decode key :)
         # C => correct pair
         # B => Both used, but not the correct pair
         # F => Forward used, not reverse
         # R => Reverse used, not forward
         # N => Neither used
-        summary_lines = {"C": "", "B": "", "F": "", "R": "", "N": ""}
+        summary_lines = {"C": [], "B": [], "F": [], "R": [], "N": []}
         tag_out = open(outprefix + ".tagInfo", "w")
         if single_end:
             tag_out.write("FTag\tRTag\tSeq\tCount\tType\n")
@@ -519,8 +521,8 @@ class sample_sorter():
                 tag_out.write(header + amplicon + "\t")
                 tag_out.write(str(amplicon_count) + footer)
                 total_seqs += amplicon_count
-            summary_lines[tag_type] += (header + str(len(current_haps)) + "\t")
-            summary_lines[tag_type] += (str(total_seqs) + footer)
+            summary_lines[tag_type].append(header + str(len(current_haps)) +
+                                           "\t" + str(total_seqs) + footer)
         tag_out.close()
         self.logger.info("Finished writing output files.")
         # Write the summary file.
@@ -537,7 +539,7 @@ class sample_sorter():
         outprefix : string
             Prefix for output summary file
         summary_lines : dict
-            Info on different types of output tag combinations
+            Lines for each of the different types of output tag combinations
 
         """
         self.logger.info("Writing summary file.")
@@ -545,19 +547,19 @@ class sample_sorter():
         tag_summary.write("Tag1\tTag2\tUniqSeqs\tTotalSeqs\tType\n")
         tag_summary.write("Correct combination of tags used in pool\n")
         tag_summary.write("----------------------------------------\n")
-        tag_summary.write(summary_lines["C"])
+        tag_summary.writelines(summary_lines["C"])
         tag_summary.write("Both tags used in pool, but not this combination\n")
         tag_summary.write("------------------------------------------------\n")
-        tag_summary.write(summary_lines["B"])
+        tag_summary.writelines(summary_lines["B"])
         tag_summary.write("Only forward tag used in pool, reverse not found\n")
         tag_summary.write("------------------------------------------------\n")
-        tag_summary.write(summary_lines["F"])
+        tag_summary.writelines(summary_lines["F"])
         tag_summary.write("Only reverse tag used in pool, forward not found\n")
         tag_summary.write("------------------------------------------------\n")
-        tag_summary.write(summary_lines["R"])
+        tag_summary.writelines(summary_lines["R"])
         tag_summary.write("Neither tag used in this pool\n")
         tag_summary.write("-----------------------------\n")
-        tag_summary.write(summary_lines["N"])
+        tag_summary.writelines(summary_lines["N"])
         tag_summary.close()
         self.logger.debug("Finished writing summary file.")
 
@@ -763,7 +765,9 @@ class sample_sorter():
     def __find_best_tag_match(self, tag):
         """Find the best tag for the given sequence.
 
-        Function to find the best tag match given, the sequence.
+        Function to find the best tag match given, the sequence. Results
+        are cached per tag sequence, since the same tag sequences turn up in
+        a large fraction of the reads.
 
         Parameters
         ----------
@@ -776,23 +780,29 @@ class sample_sorter():
             name of the best string match
 
         """
+        if tag in self._tag_match_cache:
+            return(self._tag_match_cache[tag])
         # First figure out forward tag
         best_dist = len(tag) + 100
         best_tag = ""
+        best_len = 0  # length of the best tag sequence so far
         num_matches = 0
-        for tag_name in self._tag_dict:
-            tag_seq = self._tag_dict[tag_name]
+        for tag_name, tag_seq in self._tag_dict.items():
             cur_dist = DU.find_hamming_distance(tag_seq, tag)
             if cur_dist < best_dist:
                 num_matches = 1
                 best_tag = tag_name
                 best_dist = cur_dist
+                best_len = len(tag_seq)
             elif cur_dist == best_dist:
-                if len(tag_seq) > len(self._tag_dict[best_tag]):
+                cur_len = len(tag_seq)
+                if cur_len > best_len:
                     best_tag = tag_name
+                    best_len = cur_len
                     num_matches = 1
-                elif len(tag_seq) == len(self._tag_dict[best_tag]):
+                elif cur_len == best_len:
                     num_matches += 1
         if best_dist > self.tag_errors or num_matches > 1:
             best_tag = ""
+        self._tag_match_cache[tag] = best_tag
         return(best_tag)